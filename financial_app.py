@@ -1,5 +1,5 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, filedialog
+from tkinter import ttk, messagebox, filedialog, simpledialog
 import ttkbootstrap as tb
 from ttkbootstrap.constants import *
 from ttkbootstrap.scrolled import ScrolledFrame
@@ -8,6 +8,143 @@ import pandas as pd
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import datetime
+import os
+import re
+import contextlib
+from collections import OrderedDict
+
+
+DEFAULT_LEDGER = "Personal"
+DEFAULT_LEDGER_PATH = "personal_finance.db"
+LEDGER_DIR = "ledgers"
+ALL_LEDGERS = "*"
+
+DEFAULT_CURRENCY = "BRL"
+FX_BASE_CURRENCY = "USD"
+CURRENCY_SYMBOLS = {"BRL": "R$", "USD": "$", "EUR": "€", "GBP": "£"}
+
+
+class LedgerConnectionManager:
+    """
+    Keeps a small pool of SQLite connections, one per ledger, so switching
+    between ledgers reuses an open (and already warm) connection instead of
+    reconnecting. Also builds the read-only consolidated "all ledgers" view.
+    """
+
+    MAX_CONNECTIONS = 8
+    MAX_ATTACHED = 10  # SQLite's default SQLITE_MAX_ATTACHED
+    CACHE_SIZE_KIB = 8192
+    NAME_PATTERN = re.compile(r"^[\w\- ]{1,40}$")
+
+    def __init__(self, initializer):
+        self.initializer = initializer
+        self.pool = OrderedDict()
+        self.consolidated_conn = None
+        os.makedirs(LEDGER_DIR, exist_ok=True)
+
+    def ledger_path(self, name):
+        """Returns the database file backing a ledger."""
+        if name == DEFAULT_LEDGER:
+            return DEFAULT_LEDGER_PATH
+        return os.path.join(LEDGER_DIR, f"{name}.db")
+
+    def list_ledgers(self):
+        """Lists the default ledger followed by every ledger found on disk."""
+        names = sorted(
+            os.path.splitext(f)[0] for f in os.listdir(LEDGER_DIR)
+            if f.endswith(".db") and self.NAME_PATTERN.match(os.path.splitext(f)[0])
+        )
+        return [DEFAULT_LEDGER] + [n for n in names if n != DEFAULT_LEDGER]
+
+    def create_ledger(self, name):
+        """Creates a new ledger database and returns its connection."""
+        name = name.strip()
+        if not self.NAME_PATTERN.match(name):
+            raise ValueError(f"Invalid ledger name: {name!r}")
+        # Ledger files may live on a case-insensitive filesystem.
+        if name.casefold() in {ledger.casefold() for ledger in self.list_ledgers()}:
+            raise ValueError(f"Ledger already exists: {name!r}")
+        conn = self.get(name)
+        self.reset_consolidated()
+        return conn
+
+    def get(self, name):
+        """Returns the pooled connection for a ledger, opening it if needed."""
+        if name in self.pool:
+            self.pool.move_to_end(name)
+            return self.pool[name]
+
+        conn = sqlite3.connect(self.ledger_path(name))
+        conn.execute(f"PRAGMA cache_size = -{self.CACHE_SIZE_KIB}")
+        self.initializer(conn)
+        self.warm(conn)
+        self.pool[name] = conn
+
+        while len(self.pool) > self.MAX_CONNECTIONS:
+            _, evicted = self.pool.popitem(last=False)
+            evicted.close()
+        return conn
+
+    def warm(self, conn, schema="main"):
+        """Scans the ledger tables once so their pages are in the cache."""
+        for table in ("income", "expenses"):
+            conn.execute(f"SELECT SUM(amount), MAX(date) FROM {schema}.{table}").fetchone()
+
+    def consolidated(self):
+        """
+        Returns a connection whose `income` and `expenses` are views over every
+        ledger, ATTACHed to one in-memory database, so the regular queries run
+        as a single UNION ALL across all ledgers.
+        """
+        if self.consolidated_conn is not None:
+            return self.consolidated_conn
+
+        ledgers = self.list_ledgers()
+        if len(ledgers) > self.MAX_ATTACHED:
+            raise ValueError(f"The consolidated view supports at most {self.MAX_ATTACHED} ledgers, found {len(ledgers)}.")
+        for name in ledgers:
+            if name not in self.pool:
+                # Make sure the ledger has its tables without evicting warm connections.
+                with contextlib.closing(sqlite3.connect(self.ledger_path(name))) as ledger_conn:
+                    self.initializer(ledger_conn)
+
+        conn = sqlite3.connect(":memory:")
+        try:
+            conn.execute(f"PRAGMA cache_size = -{self.CACHE_SIZE_KIB}")
+            schemas = []
+            for i, name in enumerate(ledgers):
+                schema = f"ledger_{i}"
+                conn.execute(f"ATTACH DATABASE ? AS {schema}", (self.ledger_path(name),))
+                conn.execute(f"PRAGMA {schema}.cache_size = -{self.CACHE_SIZE_KIB}")
+                schemas.append((schema, name.replace("'", "''")))
+
+            for table in ("income", "expenses"):
+                union = " UNION ALL ".join(
+                    f"SELECT *, '{label}' AS ledger FROM {schema}.{table}" for schema, label in schemas
+                )
+                conn.execute(f"CREATE TEMP VIEW {table} AS {union}")
+
+            for schema, _ in schemas:
+                self.warm(conn, schema)
+        except sqlite3.Error:
+            conn.close()
+            raise
+        self.consolidated_conn = conn
+        return conn
+
+    def reset_consolidated(self):
+        """Drops the consolidated connection so it is rebuilt on next use."""
+        if self.consolidated_conn is not None:
+            self.consolidated_conn.close()
+            self.consolidated_conn = None
+
+    def close_all(self):
+        """Closes every pooled connection."""
+        self.reset_consolidated()
+        while self.pool:
+            _, conn = self.pool.popitem()
+            conn.close()
+
 
 class FinanceTracker:
     """
@@ -15,6 +152,8 @@ class FinanceTracker:
     It allows users to manage income and expenses, view reports, and visualize data.
     """
 
+    CONVERTED_CACHE_SIZE = 32
+
     def __init__(self, root):
         self.root = root
         self.root.title("Personal Finance Tracker")
@@ -26,8 +165,13 @@ class FinanceTracker:
         self.translations = self.load_translations()
 
         # --- Database Setup ---
-        self.db_conn = sqlite3.connect('personal_finance.db')
-        self.create_tables()
+        self.ledgers = LedgerConnectionManager(self.create_tables)
+        self.current_ledger = DEFAULT_LEDGER
+        self.db_conn = self.ledgers.get(self.current_ledger)
+        self.create_fx_table(self.ledgers.get(DEFAULT_LEDGER))
+        self.converted_cache = OrderedDict()
+        self.load_fx_rates()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
         # --- Main UI Structure ---
         self.main_frame = tb.Frame(self.root, padding=10)
@@ -50,6 +194,24 @@ class FinanceTracker:
         )
         self.lang_toggle.pack(side=RIGHT, padx=10)
 
+        self.new_ledger_button = tb.Button(self.header_frame, text="", command=self.add_ledger, bootstyle="primary-outline")
+        self.new_ledger_button.pack(side=RIGHT, padx=5)
+        self.ledger_var = tk.StringVar()
+        self.ledger_combo = tb.Combobox(self.header_frame, textvariable=self.ledger_var, state="readonly", width=20)
+        self.ledger_combo.pack(side=RIGHT, padx=5)
+        self.ledger_combo.bind("<<ComboboxSelected>>", self.switch_ledger)
+        self.ledger_label = tb.Label(self.header_frame, text="")
+        self.ledger_label.pack(side=RIGHT, padx=5)
+
+        self.import_fx_button = tb.Button(self.header_frame, text="", command=self.import_fx_rates, bootstyle="primary-outline")
+        self.import_fx_button.pack(side=RIGHT, padx=5)
+        self.report_currency = tk.StringVar(value=DEFAULT_CURRENCY)
+        self.report_currency_combo = tb.Combobox(self.header_frame, textvariable=self.report_currency, state="readonly", width=6)
+        self.report_currency_combo.pack(side=RIGHT, padx=5)
+        self.report_currency_combo.bind("<<ComboboxSelected>>", self.switch_report_currency)
+        self.report_currency_label = tb.Label(self.header_frame, text="")
+        self.report_currency_label.pack(side=RIGHT, padx=5)
+
         self.notebook = tb.Notebook(self.main_frame, bootstyle="primary")
         self.notebook.pack(fill=BOTH, expand=YES)
 
@@ -89,7 +251,7 @@ class FinanceTracker:
                 "monthly_income": "Income (This Month)",
                 "monthly_expenses": "Expenses (This Month)",
                 "spending_percentage": "You spent {:.0f}% of your income this month.",
-                "no_income_warning": "You spent ${:.2f} but had no income this month.",
+                "no_income_warning": "You spent {} but had no income this month.",
                 "add_income": "Add Income",
                 "add_expense": "Add Expense",
                 "amount": "Amount",
@@ -120,9 +282,22 @@ class FinanceTracker:
                 "col_payment": "Payment Method",
                 "col_amount": "Amount",
                 "col_notes": "Notes",
+                "col_ledger": "Ledger",
                 "sources_options": ["Salary", "Gift", "Freelance", "Investment", "Other"],
                 "categories_options": ["Food", "Bills", "Transport", "Entertainment", "Health", "Shopping", "Other"],
-                "payment_options": ["Cash", "Card", "PIX", "Transfer"]
+                "payment_options": ["Cash", "Card", "PIX", "Transfer"],
+                "ledger": "Ledger:",
+                "all_ledgers": "All Ledgers",
+                "new_ledger": "New Ledger",
+                "new_ledger_prompt": "Name of the new ledger:",
+                "consolidated_read_only": "Select a single ledger to add transactions.",
+                "currency": "Currency",
+                "report_currency": "Currency:",
+                "import_fx": "Import FX Rates",
+                "fx_import_success": "Imported {} exchange rates.",
+                "fx_import_skipped": "Skipped {} invalid rows.",
+                "fx_missing_rate": "No exchange rate for {} on or before some transaction dates; those amounts are left out.",
+                "fx_invalid_date": "{} transactions with an invalid date are left out of the conversion."
             },
             "pt_br": {
                 "title": "Controle Financeiro Pessoal",
@@ -134,7 +309,7 @@ class FinanceTracker:
                 "monthly_income": "Renda (Este Mês)",
                 "monthly_expenses": "Despesas (Este Mês)",
                 "spending_percentage": "Você gastou {:.0f}% da sua renda este mês.",
-                "no_income_warning": "Você gastou R${:.2f} mas não teve renda este mês.",
+                "no_income_warning": "Você gastou {} mas não teve renda este mês.",
                 "add_income": "Adicionar Renda",
                 "add_expense": "Adicionar Despesa",
                 "amount": "Valor",
@@ -165,9 +340,22 @@ class FinanceTracker:
                 "col_payment": "Pagamento",
                 "col_amount": "Valor",
                 "col_notes": "Notas",
+                "col_ledger": "Conta",
                 "sources_options": ["Salário", "Presente", "Freelance", "Investimento", "Outro"],
                 "categories_options": ["Alimentação", "Contas", "Transporte", "Lazer", "Saúde", "Compras", "Outro"],
-                "payment_options": ["Dinheiro", "Cartão", "PIX", "Transferência"]
+                "payment_options": ["Dinheiro", "Cartão", "PIX", "Transferência"],
+                "ledger": "Conta:",
+                "all_ledgers": "Todas as Contas",
+                "new_ledger": "Nova Conta",
+                "new_ledger_prompt": "Nome da nova conta:",
+                "consolidated_read_only": "Selecione uma única conta para adicionar transações.",
+                "currency": "Moeda",
+                "report_currency": "Moeda:",
+                "import_fx": "Importar Câmbio",
+                "fx_import_success": "{} taxas de câmbio importadas.",
+                "fx_import_skipped": "{} linhas inválidas ignoradas.",
+                "fx_missing_rate": "Sem taxa de câmbio para {} até algumas datas de transação; esses valores foram ignorados.",
+                "fx_invalid_date": "{} transações com data inválida foram ignoradas na conversão."
             }
         }
 
@@ -182,18 +370,19 @@ class FinanceTracker:
         self.populate_history()
         self.update_reports_ui()
 
-    def create_tables(self):
+    def create_tables(self, conn):
         """Creates the necessary SQLite tables if they don't exist."""
-        cursor = self.db_conn.cursor()
+        cursor = conn.cursor()
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS income (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 amount REAL NOT NULL,
                 source TEXT NOT NULL,
                 date TEXT NOT NULL,
-                notes TEXT
+                notes TEXT,
+                currency TEXT NOT NULL DEFAULT '{DEFAULT_CURRENCY}'
             )
-        ''')
+        '''.format(DEFAULT_CURRENCY=DEFAULT_CURRENCY))
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS expenses (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -201,10 +390,244 @@ class FinanceTracker:
                 category TEXT NOT NULL,
                 payment_method TEXT NOT NULL,
                 date TEXT NOT NULL,
-                notes TEXT
+                notes TEXT,
+                currency TEXT NOT NULL DEFAULT '{DEFAULT_CURRENCY}'
+            )
+        '''.format(DEFAULT_CURRENCY=DEFAULT_CURRENCY))
+
+        # Databases created before amounts had a currency get the column added.
+        for table in ("income", "expenses"):
+            columns = [row[1] for row in cursor.execute(f"PRAGMA table_info({table})")]
+            if "currency" not in columns:
+                cursor.execute(f"ALTER TABLE {table} ADD COLUMN currency TEXT NOT NULL DEFAULT '{DEFAULT_CURRENCY}'")
+        conn.commit()
+
+    def create_fx_table(self, conn):
+        """Creates the FX rate table, shared by all ledgers and kept in the default one."""
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS fx_rates (
+                date TEXT NOT NULL,
+                currency TEXT NOT NULL,
+                rate REAL NOT NULL,
+                PRIMARY KEY (date, currency)
             )
         ''')
-        self.db_conn.commit()
+        conn.commit()
+
+    # --- Currency Methods ---
+    def format_amount(self, amount, currency):
+        """Formats an amount with the symbol (or code) of its currency."""
+        symbol = CURRENCY_SYMBOLS.get(currency, f"{currency} ")
+        return f"{symbol}{amount:,.2f}"
+
+    def currency_options(self):
+        """Lists the known currencies: the built-in ones plus any with imported rates."""
+        return sorted(set(CURRENCY_SYMBOLS) | {FX_BASE_CURRENCY} | set(self.fx_rates['currency']))
+
+    def load_fx_rates(self):
+        """Loads the FX rate table into memory and drops every converted result."""
+        conn = self.ledgers.get(DEFAULT_LEDGER)
+        df = pd.read_sql_query("SELECT date, currency, rate FROM fx_rates ORDER BY date", conn)
+        df['date'] = pd.to_datetime(df['date'])
+        df['currency'] = df['currency'].astype(object)  # merge_asof needs matching key dtypes
+        self.fx_rates = df
+        self.converted_cache.clear()
+
+    def import_fx_rates(self):
+        """
+        Imports FX rates from a CSV file with `date`, `currency` and `rate` columns,
+        where `rate` is the value of one unit of `currency` in FX_BASE_CURRENCY.
+        """
+        file_path = filedialog.askopenfilename(filetypes=[("CSV files", "*.csv"), ("All files", "*.*")])
+        if not file_path:
+            return
+
+        try:
+            df = pd.read_csv(file_path, usecols=['date', 'currency', 'rate'], dtype={'currency': str})
+            df['date'] = pd.to_datetime(df['date'], errors='coerce')
+            df['currency'] = df['currency'].str.strip().str.upper()
+            df['rate'] = pd.to_numeric(df['rate'], errors='coerce')
+
+            # Blank or non-positive values would break the NOT NULL constraint or divide by zero later.
+            valid = df['date'].notna() & df['currency'].fillna('').ne('') & (df['rate'] > 0)
+            skipped = int((~valid).sum())
+            df = df[valid].copy()
+            df['date'] = df['date'].dt.strftime('%Y-%m-%d')
+
+            conn = self.ledgers.get(DEFAULT_LEDGER)
+            conn.executemany("INSERT OR REPLACE INTO fx_rates (date, currency, rate) VALUES (?, ?, ?)",
+                             df[['date', 'currency', 'rate']].itertuples(index=False, name=None))
+            conn.commit()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to import rates: {e}")
+            return
+
+        self.load_fx_rates()
+        message = self.get_translation("fx_import_success").format(len(df))
+        if skipped:
+            message += " " + self.get_translation("fx_import_skipped").format(skipped)
+        messagebox.showinfo("Success", message)
+        self.update_currency_options()
+        self.update_dashboard()
+        self.generate_reports()
+
+    def fx_rate_asof(self, dates, currencies):
+        """
+        Vectorized as-of lookup: for every (date, currency) pair returns the latest
+        rate on or before that date, or NaN when there is none.
+        """
+        if self.fx_rates.empty:
+            return pd.Series(1.0, index=currencies.index).where(currencies == FX_BASE_CURRENCY).to_numpy()
+
+        left = pd.DataFrame({'date': dates.to_numpy(), 'currency': currencies.to_numpy(), 'row': range(len(dates))})
+        left['currency'] = left['currency'].astype(object)
+        merged = pd.merge_asof(left.sort_values('date'), self.fx_rates, on='date', by='currency', direction='backward')
+        merged.loc[merged['currency'] == FX_BASE_CURRENCY, 'rate'] = 1.0
+        return merged.sort_values('row')['rate'].to_numpy()
+
+    def convert_amounts(self, df, currency):
+        """
+        Adds a `converted` column with each amount expressed in `currency`. Rows
+        already in `currency` are copied as-is; rows that cannot be converted are
+        left as NaN, with `missing_rate` naming the currency that had no rate
+        (rows without a valid date have no `missing_rate`).
+        """
+        same = df['currency'] == currency
+        df['converted'] = df['amount'].where(same)
+        df['missing_rate'] = pd.Series(None, index=df.index, dtype=object)
+        needs_rate = ~same & df['date'].notna()
+        if needs_rate.any():
+            other = df[needs_rate]
+            source_rate = pd.Series(self.fx_rate_asof(other['date'], other['currency']), index=other.index)
+            target_rate = pd.Series(self.fx_rate_asof(other['date'], pd.Series(currency, index=other.index)), index=other.index)
+            df.loc[needs_rate, 'converted'] = other['amount'] * source_rate / target_rate
+            df.loc[source_rate.index[source_rate.isna()], 'missing_rate'] = other.loc[source_rate.isna(), 'currency']
+            df.loc[target_rate.index[target_rate.isna()], 'missing_rate'] = currency
+        return df
+
+    def describe_conversion_gaps(self, df, currency):
+        """Explains which amounts were left out of a converted total, or returns ''."""
+        missing = df['converted'].isna()
+        undated = missing & df['date'].isna()
+        no_rate = sorted(set(df['missing_rate'].dropna()))
+        notes = []
+        if no_rate:
+            notes.append(self.get_translation("fx_missing_rate").format(", ".join(no_rate)))
+        if undated.any():
+            notes.append(self.get_translation("fx_invalid_date").format(int(undated.sum())))
+        return " ".join(notes)
+
+    def ledger_currencies(self):
+        """Returns the distinct currencies used by the current ledger (or all of them)."""
+        cursor = self.db_conn.execute("SELECT currency FROM income UNION SELECT currency FROM expenses")
+        return {row[0] for row in cursor.fetchall()}
+
+    def is_single_currency(self, currency):
+        """Whether every amount is already in `currency`, so plain SQL aggregates can be used."""
+        return self.ledger_currencies() <= {currency}
+
+    def invalidate_converted(self, ledger):
+        """Drops the converted results that include a ledger that just changed."""
+        for key in [key for key in self.converted_cache if key[0] in (ledger, ALL_LEDGERS)]:
+            del self.converted_cache[key]
+
+    def get_converted_transactions(self, start_date, end_date):
+        """
+        Returns the transactions between two dates with amounts converted to the
+        reporting currency, memoized per (ledger, currency, range).
+        """
+        key = (self.current_ledger, self.report_currency.get(), start_date, end_date)
+        if key in self.converted_cache:
+            self.converted_cache.move_to_end(key)
+            return self.converted_cache[key]
+
+        query = """
+        SELECT date, 'Income' AS type, source AS category, amount, currency FROM income WHERE date BETWEEN ? AND ?
+        UNION ALL
+        SELECT date, 'Expense', category, amount, currency FROM expenses WHERE date BETWEEN ? AND ?
+        """
+        df = pd.read_sql_query(query, self.db_conn, params=(start_date, end_date) * 2)
+        # Dates typed by hand may not be ISO; those rows are reported rather than crashing the join.
+        df['date'] = pd.to_datetime(df['date'], format='%Y-%m-%d', errors='coerce')
+        df = self.convert_amounts(df, key[1])
+
+        self.converted_cache[key] = df
+        while len(self.converted_cache) > self.CONVERTED_CACHE_SIZE:
+            self.converted_cache.popitem(last=False)
+        return df
+
+    def update_currency_options(self):
+        """Reloads the currency choices in the header and transaction forms."""
+        options = self.currency_options()
+        self.report_currency_combo['values'] = options
+        self.income_currency_combo['values'] = options
+        self.expense_currency_combo['values'] = options
+
+    def switch_report_currency(self, event=None):
+        """Redraws the dashboard and reports in the selected reporting currency."""
+        self.update_dashboard()
+        self.generate_reports()
+
+    # --- Ledger Methods ---
+    def refresh_ledger_list(self, select=None):
+        """Reloads the ledger selector, selecting `select` (by default the current ledger)."""
+        select = select or self.current_ledger
+        self.ledger_names = self.ledgers.list_ledgers()
+        self.ledger_combo['values'] = [self.get_translation("all_ledgers")] + self.ledger_names
+        if select == ALL_LEDGERS:
+            self.ledger_combo.current(0)
+        else:
+            self.ledger_combo.current(self.ledger_names.index(select) + 1)
+
+    def switch_ledger(self, event=None):
+        """Points the app at the selected ledger (or all of them) and refreshes the views."""
+        index = self.ledger_combo.current()
+        try:
+            if index == 0:
+                ledger, conn = ALL_LEDGERS, self.ledgers.consolidated()
+            else:
+                ledger = self.ledger_names[index - 1]
+                conn = self.ledgers.get(ledger)
+        except (ValueError, sqlite3.Error) as e:
+            messagebox.showerror("Error", str(e))
+            self.refresh_ledger_list()  # puts the selector back on the previous ledger
+            return
+        self.current_ledger = ledger
+        self.db_conn = conn
+        self.update_dashboard()
+        self.populate_history()
+        self.generate_reports()
+
+    def add_ledger(self):
+        """Asks for a name, creates the ledger and switches to it."""
+        name = simpledialog.askstring(self.get_translation("new_ledger"), self.get_translation("new_ledger_prompt"), parent=self.root)
+        if not name:
+            return
+        # A ledger named like the consolidated entry would be indistinguishable from it.
+        reserved = {translation["all_ledgers"].casefold() for translation in self.translations.values()}
+        if name.strip().casefold() in reserved:
+            messagebox.showerror("Error", f"Invalid ledger name: {name.strip()!r}")
+            return
+        try:
+            self.ledgers.create_ledger(name)
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
+            return
+        # current_ledger only changes once switch_ledger has connected.
+        self.refresh_ledger_list(select=name.strip())
+        self.switch_ledger()
+
+    def check_ledger_writable(self):
+        """Warns and returns False when the consolidated (read-only) view is active."""
+        if self.current_ledger == ALL_LEDGERS:
+            messagebox.showwarning("Input Error", self.get_translation("consolidated_read_only"))
+            return False
+        return True
+
+    def on_close(self):
+        """Closes all ledger connections before quitting."""
+        self.ledgers.close_all()
+        self.root.destroy()
 
     # --- Dashboard Methods ---
     def create_dashboard_widgets(self):
@@ -242,35 +665,50 @@ class FinanceTracker:
         self.spending_label = tb.Label(frame, text="", font=("Helvetica", 14, "italic"))
         self.spending_label.pack(pady=20)
 
+        # Conversion Warnings
+        self.dashboard_fx_label = tb.Label(frame, text="", bootstyle=WARNING)
+        self.dashboard_fx_label.pack()
+
     def update_dashboard(self):
         """Fetches and displays the latest financial summary on the dashboard."""
-        cursor = self.db_conn.cursor()
-        
+        currency = self.report_currency.get()
+        month_start = datetime.date.today().strftime('%Y-%m-01')
+
+        if self.is_single_currency(currency):
+            # Everything is already in the reporting currency: plain SQL aggregates.
+            cursor = self.db_conn.cursor()
+            cursor.execute("SELECT SUM(amount) FROM income")
+            total_income = cursor.fetchone()[0] or 0
+            cursor.execute("SELECT SUM(amount) FROM expenses")
+            total_expenses = cursor.fetchone()[0] or 0
+            balance = total_income - total_expenses
+            cursor.execute("SELECT SUM(amount) FROM income WHERE date >= ?", (month_start,))
+            monthly_income = cursor.fetchone()[0] or 0
+            cursor.execute("SELECT SUM(amount) FROM expenses WHERE date >= ?", (month_start,))
+            monthly_expenses = cursor.fetchone()[0] or 0
+            self.dashboard_fx_label.config(text="")
+        else:
+            df = self.get_converted_transactions('0000-01-01', '9999-12-31')
+            is_income = df['type'] == 'Income'
+            this_month = df['date'] >= pd.Timestamp(month_start)
+            balance = df.loc[is_income, 'converted'].sum() - df.loc[~is_income, 'converted'].sum()
+            monthly_income = df.loc[is_income & this_month, 'converted'].sum()
+            monthly_expenses = df.loc[~is_income & this_month, 'converted'].sum()
+            self.dashboard_fx_label.config(text=self.describe_conversion_gaps(df, currency))
+
         # Total Balance
-        cursor.execute("SELECT SUM(amount) FROM income")
-        total_income = cursor.fetchone()[0] or 0
-        cursor.execute("SELECT SUM(amount) FROM expenses")
-        total_expenses = cursor.fetchone()[0] or 0
-        balance = total_income - total_expenses
-        currency_symbol = "R$" if self.current_language.get() == 'pt_br' else "$"
-        self.balance_label_value.config(text=f"{currency_symbol}{balance:,.2f}")
+        self.balance_label_value.config(text=self.format_amount(balance, currency))
 
         # Monthly Summary
-        today = datetime.date.today()
-        month_start = today.strftime('%Y-%m-01')
-        cursor.execute("SELECT SUM(amount) FROM income WHERE date >= ?", (month_start,))
-        monthly_income = cursor.fetchone()[0] or 0
-        cursor.execute("SELECT SUM(amount) FROM expenses WHERE date >= ?", (month_start,))
-        monthly_expenses = cursor.fetchone()[0] or 0
-        self.income_label_value.config(text=f"{currency_symbol}{monthly_income:,.2f}")
-        self.expense_label_value.config(text=f"{currency_symbol}{monthly_expenses:,.2f}")
+        self.income_label_value.config(text=self.format_amount(monthly_income, currency))
+        self.expense_label_value.config(text=self.format_amount(monthly_expenses, currency))
         
         # Spending Percentage
         if monthly_income > 0:
             percentage = (monthly_expenses / monthly_income) * 100
             self.spending_label.config(text=self.get_translation("spending_percentage").format(percentage))
         elif monthly_expenses > 0:
-            self.spending_label.config(text=self.get_translation("no_income_warning").format(monthly_expenses))
+            self.spending_label.config(text=self.get_translation("no_income_warning").format(self.format_amount(monthly_expenses, currency)))
         else:
             self.spending_label.config(text="")
             
@@ -287,6 +725,7 @@ class FinanceTracker:
         self.income_amount_var = tk.DoubleVar()
         self.income_date_var = tk.StringVar(value=datetime.date.today().strftime('%Y-%m-%d'))
         self.income_notes_var = tk.StringVar()
+        self.income_currency_var = tk.StringVar(value=DEFAULT_CURRENCY)
 
         self.income_amount_label = tb.Label(income_frame, text="", font=("Helvetica", 12))
         self.income_amount_label.grid(row=0, column=0, sticky=W, padx=5, pady=5)
@@ -305,8 +744,13 @@ class FinanceTracker:
         self.income_notes_label.grid(row=3, column=0, sticky=W, padx=5, pady=5)
         tb.Entry(income_frame, textvariable=self.income_notes_var, bootstyle=SUCCESS).grid(row=3, column=1, sticky=EW, padx=5, pady=5)
 
+        self.income_currency_label = tb.Label(income_frame, text="", font=("Helvetica", 12))
+        self.income_currency_label.grid(row=4, column=0, sticky=W, padx=5, pady=5)
+        self.income_currency_combo = tb.Combobox(income_frame, textvariable=self.income_currency_var, state="readonly", bootstyle=SUCCESS)
+        self.income_currency_combo.grid(row=4, column=1, sticky=EW, padx=5, pady=5)
+
         self.add_income_button = tb.Button(income_frame, text="", command=self.add_income, bootstyle="success")
-        self.add_income_button.grid(row=4, column=0, columnspan=2, pady=20)
+        self.add_income_button.grid(row=5, column=0, columnspan=2, pady=20)
         income_frame.columnconfigure(1, weight=1)
 
         # --- Expense Tab ---
@@ -316,6 +760,7 @@ class FinanceTracker:
         self.expense_payment_var = tk.StringVar()
         self.expense_date_var = tk.StringVar(value=datetime.date.today().strftime('%Y-%m-%d'))
         self.expense_notes_var = tk.StringVar()
+        self.expense_currency_var = tk.StringVar(value=DEFAULT_CURRENCY)
 
         self.expense_amount_label = tb.Label(expense_frame, text="", font=("Helvetica", 12))
         self.expense_amount_label.grid(row=0, column=0, sticky=W, padx=5, pady=5)
@@ -339,8 +784,13 @@ class FinanceTracker:
         self.expense_notes_label.grid(row=4, column=0, sticky=W, padx=5, pady=5)
         tb.Entry(expense_frame, textvariable=self.expense_notes_var, bootstyle=DANGER).grid(row=4, column=1, sticky=EW, padx=5, pady=5)
 
+        self.expense_currency_label = tb.Label(expense_frame, text="", font=("Helvetica", 12))
+        self.expense_currency_label.grid(row=5, column=0, sticky=W, padx=5, pady=5)
+        self.expense_currency_combo = tb.Combobox(expense_frame, textvariable=self.expense_currency_var, state="readonly", bootstyle=DANGER)
+        self.expense_currency_combo.grid(row=5, column=1, sticky=EW, padx=5, pady=5)
+
         self.add_expense_button = tb.Button(expense_frame, text="", command=self.add_expense, bootstyle="danger")
-        self.add_expense_button.grid(row=5, column=0, columnspan=2, pady=20)
+        self.add_expense_button.grid(row=6, column=0, columnspan=2, pady=20)
         expense_frame.columnconfigure(1, weight=1)
 
         trans_notebook.add(income_frame, text=self.get_translation("add_income"))
@@ -353,15 +803,19 @@ class FinanceTracker:
         source = self.income_source_var.get()
         date = self.income_date_var.get()
         notes = self.income_notes_var.get()
+        currency = self.income_currency_var.get().strip().upper()
 
-        if not amount or not source or not date:
-            messagebox.showwarning("Input Error", "Amount, Source, and Date are required.")
+        if not self.check_ledger_writable():
+            return
+        if not amount or not source or not date or not currency:
+            messagebox.showwarning("Input Error", "Amount, Source, Date, and Currency are required.")
             return
 
         cursor = self.db_conn.cursor()
-        cursor.execute("INSERT INTO income (amount, source, date, notes) VALUES (?, ?, ?, ?)",
-                       (amount, source, date, notes))
+        cursor.execute("INSERT INTO income (amount, source, date, notes, currency) VALUES (?, ?, ?, ?, ?)",
+                       (amount, source, date, notes, currency))
         self.db_conn.commit()
+        self.invalidate_converted(self.current_ledger)
         messagebox.showinfo("Success", self.get_translation("income_success"))
         self.income_amount_var.set(0.0)
         self.income_notes_var.set("")
@@ -375,15 +829,19 @@ class FinanceTracker:
         payment_method = self.expense_payment_var.get()
         date = self.expense_date_var.get()
         notes = self.expense_notes_var.get()
+        currency = self.expense_currency_var.get().strip().upper()
         
-        if not amount or not category or not payment_method or not date:
-            messagebox.showwarning("Input Error", "Amount, Category, Payment Method, and Date are required.")
+        if not self.check_ledger_writable():
+            return
+        if not amount or not category or not payment_method or not date or not currency:
+            messagebox.showwarning("Input Error", "Amount, Category, Payment Method, Date, and Currency are required.")
             return
 
         cursor = self.db_conn.cursor()
-        cursor.execute("INSERT INTO expenses (amount, category, payment_method, date, notes) VALUES (?, ?, ?, ?, ?)",
-                       (amount, category, payment_method, date, notes))
+        cursor.execute("INSERT INTO expenses (amount, category, payment_method, date, notes, currency) VALUES (?, ?, ?, ?, ?, ?)",
+                       (amount, category, payment_method, date, notes, currency))
         self.db_conn.commit()
+        self.invalidate_converted(self.current_ledger)
         messagebox.showinfo("Success", self.get_translation("expense_success"))
         self.expense_amount_var.set(0.0)
         self.expense_notes_var.set("")
@@ -420,7 +878,7 @@ class FinanceTracker:
         tree_frame = tb.Frame(self.history_tab)
         tree_frame.pack(fill=BOTH, expand=YES, padx=10, pady=10)
         
-        self.history_tree = tb.Treeview(tree_frame, columns=("date", "type", "category_source", "payment", "amount", "notes"), show="headings", bootstyle=PRIMARY)
+        self.history_tree = tb.Treeview(tree_frame, columns=("ledger", "date", "type", "category_source", "payment", "amount", "notes"), show="headings", bootstyle=PRIMARY)
         self.history_tree.pack(side=LEFT, fill=BOTH, expand=YES)
 
         vsb = tb.Scrollbar(tree_frame, orient="vertical", command=self.history_tree.yview, bootstyle="primary-round")
@@ -437,9 +895,15 @@ class FinanceTracker:
             self.history_tree.delete(i)
 
         cursor = self.db_conn.cursor()
-        
-        income_query = "SELECT date, 'Income', source, '', amount, notes FROM income"
-        expense_query = "SELECT date, 'Expense', category, payment_method, -amount, notes FROM expenses"
+
+        # The ledger column only exists (and only matters) in the consolidated view.
+        consolidated = self.current_ledger == ALL_LEDGERS
+        columns = self.history_tree['columns']
+        self.history_tree['displaycolumns'] = columns if consolidated else columns[1:]
+        ledger_column = ", ledger" if consolidated else ""
+
+        income_query = f"SELECT date, 'Income', source, '', amount, notes, currency{ledger_column} FROM income"
+        expense_query = f"SELECT date, 'Expense', category, payment_method, -amount, notes, currency{ledger_column} FROM expenses"
 
         trans_type = self.history_type_var.get()
         queries = []
@@ -458,24 +922,28 @@ class FinanceTracker:
         # Sort by date
         all_transactions.sort(key=lambda x: x[0], reverse=True)
         
-        currency_symbol = "R$" if self.current_language.get() == 'pt_br' else "$"
         for row in all_transactions:
             tag = 'income' if row[1] == 'Income' else 'expense'
-            amount_str = f"{currency_symbol}{abs(row[4]):,.2f}"
-            display_row = (row[0], self.get_translation(row[1].lower()), row[2], row[3], amount_str, row[5])
+            amount_str = self.format_amount(abs(row[4]), row[6])
+            ledger = row[7] if consolidated else ""
+            display_row = (ledger, row[0], self.get_translation(row[1].lower()), row[2], row[3], amount_str, row[5])
             self.history_tree.insert("", "end", values=display_row, tags=(tag,))
 
     def export_to_csv(self):
         """Exports the transaction history to a CSV file."""
+        consolidated = self.current_ledger == ALL_LEDGERS
+        ledger_column = ", ledger" if consolidated else ""
+        columns = ['Date', 'Type', 'Category/Source', 'Payment Method', 'Amount', 'Currency', 'Notes'] + (['Ledger'] if consolidated else [])
+
         cursor = self.db_conn.cursor()
-        cursor.execute("SELECT date, 'Income' as type, source as 'category/source', '' as payment_method, amount, notes FROM income UNION ALL SELECT date, 'Expense' as type, category, payment_method, -amount, notes FROM expenses ORDER BY date DESC")
+        cursor.execute(f"SELECT date, 'Income' as type, source as 'category/source', '' as payment_method, amount, currency, notes{ledger_column} FROM income UNION ALL SELECT date, 'Expense' as type, category, payment_method, -amount, currency, notes{ledger_column} FROM expenses ORDER BY date DESC")
         data = cursor.fetchall()
         
         if not data:
             messagebox.showinfo("No Data", "There is no data to export.")
             return
 
-        df = pd.DataFrame(data, columns=['Date', 'Type', 'Category/Source', 'Payment Method', 'Amount', 'Notes'])
+        df = pd.DataFrame(data, columns=columns)
         
         try:
             file_path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV files", "*.csv"), ("All files", "*.*")])
@@ -510,6 +978,8 @@ class FinanceTracker:
 
         self.generate_report_button = tb.Button(reports_filter_frame, text="", command=self.generate_reports, bootstyle="primary")
         self.generate_report_button.grid(row=0, column=4, padx=20, pady=5)
+        self.reports_fx_label = tb.Label(reports_filter_frame, text="", bootstyle=WARNING)
+        self.reports_fx_label.grid(row=0, column=5, padx=5, pady=5)
         
         # Chart Frames
         chart_frame = tb.Frame(self.reports_main_frame)
@@ -529,6 +999,12 @@ class FinanceTracker:
 
     def generate_reports(self):
         """Generates and displays the pie and line charts."""
+        currency = self.report_currency.get()
+        if self.is_single_currency(currency):
+            self.reports_fx_label.config(text="")
+        else:
+            df = self.get_converted_transactions(self.report_start_date.get(), self.report_end_date.get())
+            self.reports_fx_label.config(text=self.describe_conversion_gaps(df, currency))
         self.generate_pie_chart()
         self.generate_line_chart()
         
@@ -540,9 +1016,16 @@ class FinanceTracker:
         start_date = self.report_start_date.get()
         end_date = self.report_end_date.get()
 
-        cursor = self.db_conn.cursor()
-        cursor.execute("SELECT category, SUM(amount) FROM expenses WHERE date BETWEEN ? AND ? GROUP BY category", (start_date, end_date))
-        data = cursor.fetchall()
+        if self.is_single_currency(self.report_currency.get()):
+            cursor = self.db_conn.cursor()
+            cursor.execute("SELECT category, SUM(amount) FROM expenses WHERE date BETWEEN ? AND ? GROUP BY category", (start_date, end_date))
+            data = cursor.fetchall()
+        else:
+            # Amounts that could not be converted are left out rather than drawn as empty wedges.
+            df = self.get_converted_transactions(start_date, end_date)
+            expenses = df[(df['type'] == 'Expense') & df['converted'].notna()]
+            totals = expenses.groupby('category')['converted'].sum()
+            data = list(totals[totals > 0].items())
 
         fig = Figure(figsize=(5, 4), dpi=100, facecolor=tb.Style().colors.bg)
         ax = fig.add_subplot(111)
@@ -573,18 +1056,26 @@ class FinanceTracker:
         start_date = self.report_start_date.get()
         end_date = self.report_end_date.get()
         
-        query = """
-        SELECT date, SUM(amount) as daily_net
-        FROM (
-            SELECT date, amount FROM income
-            UNION ALL
-            SELECT date, -amount FROM expenses
-        )
-        WHERE date BETWEEN ? AND ?
-        GROUP BY date
-        ORDER BY date
-        """
-        df = pd.read_sql_query(query, self.db_conn, params=(start_date, end_date))
+        if self.is_single_currency(self.report_currency.get()):
+            query = """
+            SELECT date, SUM(amount) as daily_net
+            FROM (
+                SELECT date, amount FROM income
+                UNION ALL
+                SELECT date, -amount FROM expenses
+            )
+            WHERE date BETWEEN ? AND ?
+            GROUP BY date
+            ORDER BY date
+            """
+            df = pd.read_sql_query(query, self.db_conn, params=(start_date, end_date))
+            df['date'] = pd.to_datetime(df['date'], format='%Y-%m-%d', errors='coerce')
+            df = df.dropna(subset=['date'])
+        else:
+            transactions = self.get_converted_transactions(start_date, end_date)
+            transactions = transactions[transactions['converted'].notna()]
+            signed = transactions['converted'].where(transactions['type'] == 'Income', -transactions['converted'])
+            df = signed.groupby(transactions['date']).sum().rename('daily_net').reset_index()
         
         fig = Figure(figsize=(5, 4), dpi=100, facecolor=tb.Style().colors.bg)
         ax = fig.add_subplot(111)
@@ -592,7 +1083,6 @@ class FinanceTracker:
         fig.subplots_adjust(bottom=0.2)
         
         if not df.empty:
-            df['date'] = pd.to_datetime(df['date'])
             df['balance'] = df['daily_net'].cumsum()
             ax.plot(df['date'], df['balance'], marker='o', linestyle='-', color=tb.Style().colors.primary)
             ax.tick_params(axis='x', labelrotation=45, colors='white')
@@ -615,6 +1105,12 @@ class FinanceTracker:
         
         self.root.title(self.get_translation("title"))
         self.title_label.config(text=self.get_translation("title"))
+        self.ledger_label.config(text=self.get_translation("ledger"))
+        self.new_ledger_button.config(text=self.get_translation("new_ledger"))
+        self.refresh_ledger_list()
+        self.report_currency_label.config(text=self.get_translation("report_currency"))
+        self.import_fx_button.config(text=self.get_translation("import_fx"))
+        self.update_currency_options()
         
         # Notebook tabs
         self.notebook.tab(0, text=self.get_translation("dashboard"))
@@ -635,6 +1131,7 @@ class FinanceTracker:
         self.income_source_label.config(text=self.get_translation("source"))
         self.income_date_label.config(text=self.get_translation("date"))
         self.income_notes_label.config(text=self.get_translation("notes"))
+        self.income_currency_label.config(text=self.get_translation("currency"))
         self.add_income_button.config(text=self.get_translation("add_button"))
         self.income_source_combo['values'] = self.get_translation("sources_options")
 
@@ -643,6 +1140,7 @@ class FinanceTracker:
         self.expense_payment_label.config(text=self.get_translation("payment_method"))
         self.expense_date_label.config(text=self.get_translation("date"))
         self.expense_notes_label.config(text=self.get_translation("notes"))
+        self.expense_currency_label.config(text=self.get_translation("currency"))
         self.add_expense_button.config(text=self.get_translation("add_button"))
         self.expense_category_combo['values'] = self.get_translation("categories_options")
         self.expense_payment_combo['values'] = self.get_translation("payment_options")
@@ -662,6 +1160,7 @@ class FinanceTracker:
         self.history_tree.heading("payment", text=self.get_translation("col_payment"))
         self.history_tree.heading("amount", text=self.get_translation("col_amount"))
         self.history_tree.heading("notes", text=self.get_translation("col_notes"))
+        self.history_tree.heading("ledger", text=self.get_translation("col_ledger"))
         
         # Reports
         self.update_reports_ui()